@@ -3,13 +3,143 @@ AC Finder Agent - Searches for best BTU air conditioners from Singer and Abans
 Uses OpenAI API for intelligent product analysis and comparison
 """
 
-import requests
-from bs4 import BeautifulSoup
-import json
-import re
-from openai import OpenAI
+import asyncio
+import aiohttp
+import hashlib
+import numpy as np
+import orjson
+import openai
+from openai import AsyncOpenAI, OpenAI
 import os
+import pathlib
+import sys
 from datetime import datetime
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+
+from parse_products import MAX_BTU, parse_abans_html, parse_singer_html
+
+SINGER_URL = "https://www.singersl.com/products/appliances/air-conditioner"
+ABANS_URL = "https://buyabans.com/home-appliance/air-conditioners"
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+}
+
+# Connection pool limits: total open sockets and sockets kept per retailer host
+POOL_MAXSIZE = 8
+POOL_PER_HOST = 4
+
+# Columns of the product store, in the order they are serialized
+PRODUCT_FIELDS = ('brand', 'name', 'btu', 'price', 'url')
+
+# Retailers to scrape: brand label, listing URL and the parser for that site's HTML
+RETAILERS = (
+    {'brand': 'Singer', 'url': SINGER_URL, 'parse': parse_singer_html},
+    {'brand': 'Abans', 'url': ABANS_URL, 'parse': parse_abans_html},
+)
+
+# Concurrent OpenAI requests when several analyses run at once, and the errors worth retrying
+MAX_CONCURRENT_AI_CALLS = 10
+RETRYABLE_AI_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+)
+
+# Where the agent's caches live (AI analyses, HTTP validators, whole runs per date and
+# target BTU), and how long a memoized run stays fresh
+CACHE_DIR = pathlib.Path.home() / '.cache' / 'ac_finder'
+RUN_CACHE_TTL = 6 * 60 * 60
+
+# Upper bound on how much of a listing page is read before parsing
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+
+async def _fetch(session, url, validators=None):
+    """
+    Fetch a page and return (html, response headers, truncated), with html capped at MAX_PAGE_BYTES
+    
+    When validators from a previous response are given the request is conditional,
+    and html is None if the server answers 304 Not Modified. Other non-2xx statuses raise.
+    """
+    headers = {}
+    if validators:
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+    
+    data = bytearray()
+    async with session.get(url, headers=headers) as resp:
+        if resp.status == 304:
+            return None, resp.headers, False
+        # Error pages would parse to zero rows and pass for a successful scrape
+        resp.raise_for_status()
+        async for chunk in resp.content.iter_chunked(64 * 1024):
+            data += chunk
+            if len(data) > MAX_PAGE_BYTES:
+                break
+    truncated = len(data) > MAX_PAGE_BYTES
+    if truncated:
+        print(f"ℹ️  {url} is larger than {MAX_PAGE_BYTES} bytes; parsing only the first part")
+    return bytes(data[:MAX_PAGE_BYTES]), resp.headers, truncated
+
+
+# Stable system prompt, kept ahead of the per-run product list so OpenAI's
+# automatic prompt caching can reuse it (the prefix must exceed ~1024 tokens)
+SYSTEM_PROMPT = """You are an expert in air conditioning systems and consumer electronics, advising shoppers in Sri Lanka who are comparing split-type air conditioners sold by Singer and Abans.
+
+For every list of products you receive, analyze them and provide:
+1. Best value for money
+2. Most energy efficient options
+3. Recommendations based on BTU capacity
+4. Price comparison between brands
+
+Provide a concise analysis and recommendation. Be concise.
+
+Air conditioner buying reference
+
+Cooling capacity (BTU)
+- BTU per hour measures how much heat a unit can remove from a room. Undersized units run continuously without reaching the set temperature; oversized units short-cycle, cool unevenly and leave the room clammy because they stop before removing enough moisture.
+- For Sri Lanka's hot, humid climate a practical rule of thumb is roughly 60 to 70 BTU per square foot of floor area for a room with a standard ceiling height of about 9 to 10 feet.
+- Common sizing guide: 9000 BTU for rooms up to about 120 to 150 square feet; 12000 BTU for about 150 to 200 square feet; 18000 BTU for about 250 to 300 square feet; 24000 BTU for about 350 to 400 square feet; larger spaces usually need 30000 BTU or multiple units.
+- Add roughly 10 percent capacity for rooms with strong afternoon sun, west-facing glass, top-floor rooms under a bare roof slab, or high ceilings. Add about 600 BTU for each regular occupant beyond two, and more for kitchens or rooms with heat-producing equipment.
+- Subtract roughly 10 percent for well shaded rooms, rooms with insulated ceilings, or rooms used mainly at night.
+- When a shopper asks for a specific BTU, treat products within about 2000 BTU as close alternatives and explain whether the difference matters for a typical room.
+
+Compressor technology and efficiency
+- Inverter air conditioners vary compressor speed to hold the set temperature instead of switching on and off. In daily use they typically consume 30 to 50 percent less electricity than fixed-speed (non-inverter) models, run more quietly and keep temperature more stable.
+- Non-inverter models have a lower purchase price but higher running cost. They can make sense for rooms used only occasionally or for short periods.
+- Efficiency ratings such as EER, CSPF or SEER, and the Sri Lanka Sustainable Energy Authority energy label stars, indicate running cost. Higher numbers and more stars mean lower electricity bills for the same cooling.
+- Look for model names containing words such as "Inverter", "DC Inverter", "Dual Inverter" or "Eco" as hints of inverter technology when explicit ratings are not given. Do not invent ratings that are not present in the product data; say when efficiency cannot be determined from the listing.
+- Modern refrigerants such as R32 are more efficient and have lower global warming potential than older R410A or R22 units.
+
+Running cost
+- Residential electricity in Sri Lanka is billed on block tariffs, so heavy air conditioner use can push a household into higher per-unit price blocks. Efficiency matters more for households that run the unit for many hours per day.
+- As a rough guide, a 12000 BTU non-inverter unit draws about 1.1 to 1.3 kW while running, whereas a comparable inverter unit averages well under 1 kW over a typical night once the room has cooled down.
+- When comparing prices, consider the total cost of ownership over several years, not only the sticker price. A more expensive inverter model often recovers the price difference within two to three years of regular use.
+
+Features that matter
+- Dehumidification or "dry" mode is valuable in humid coastal areas such as Colombo.
+- Anti-corrosion coatings on the outdoor condenser (often marketed as "gold fin", "blue fin" or similar) extend life in coastal and salty air.
+- Washable or antibacterial filters, auto-clean functions, sleep modes, timers and Wi-Fi control are conveniences; mention them only when they appear in the product data.
+- Noise levels for indoor units below about 25 to 30 dB are comfortable for bedrooms.
+
+Brands, warranty and service
+- Singer and Abans are large Sri Lankan retailers that sell several manufacturers' models, including their own house brands and international brands. Compare like-for-like capacity and technology across retailers.
+- Compressor warranties commonly range from five to ten years, with shorter warranties on other parts. Installation charges, copper piping length and the availability of local after-sales service can significantly change the real cost.
+- Listed prices may include promotional discounts, installment offers or bank card deals. Treat the listed price as indicative and note when a price is missing ("N/A").
+
+How to answer
+- Base every statement on the products provided; quote product names and prices exactly as given.
+- Group recommendations by BTU capacity where several capacities are present.
+- Identify a single best value pick and, where possible, a most energy efficient pick, and briefly justify each.
+- Compare Singer and Abans prices for similar capacity and technology when both are available; say so when only one retailer returned products.
+- Keep the whole answer short, well structured and easy to scan, using brief bullet points rather than long paragraphs.
+"""
+
 
 class ACFinderAgent:
     def __init__(self, api_key, target_btu=None):
@@ -21,122 +151,103 @@ class ACFinderAgent:
             target_btu: Target BTU value to search for (e.g., 12000, 18000)
         """
         self.client = OpenAI(api_key=api_key)
+        self._api_key = api_key
         self.target_btu = target_btu
-        self.products = []
+        self.retailers = RETAILERS
+        # Products are stored column-wise; match_type is filled in by find_matching_btu
+        self._cols = {field: [] for field in PRODUCT_FIELDS + ('match_type',)}
+        self._cache_path = CACHE_DIR / 'ai_cache.json'
+        self._http_cache_path = CACHE_DIR / 'http_cache.json'
         
-    def scrape_singer(self):
-        """Scrape Singer website for AC products"""
-        url = "https://www.singersl.com/products/appliances/air-conditioner"
+    def add_product(self, **fields):
+        """Append one product to the column store"""
+        for field in PRODUCT_FIELDS:
+            self._cols[field].append(fields[field])
+        self._cols['match_type'].append(None)
+    
+    def dicts(self, indices=None):
+        """Build per-product dicts for the given row indices (all rows by default)"""
+        cols = self._cols
+        if indices is None:
+            indices = range(len(cols['name']))
+        rows = []
+        for i in indices:
+            row = {field: cols[field][i] for field in PRODUCT_FIELDS}
+            if cols['match_type'][i]:
+                row['match_type'] = cols['match_type'][i]
+            rows.append(row)
+        return rows
+    
+    async def scrape_all(self):
+        """
+        Fetch every retailer concurrently over one session, parsing each page as soon as it arrives
         
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            }
-            response = requests.get(url, headers=headers, timeout=20)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find product containers based on debug findings
-            # Look for common product wrappers
-            products = soup.select('.product, .productfilter, .views-row')
-            
-            for product in products:
-                try:
-                    name = ""
-                    # Prioritize finding the image with alt text as it contains the full product name
-                    img_elem = product.select_one('img[alt]')
-                    if img_elem:
-                         name = img_elem.get('alt', '').strip()
-                    
-                    if not name:
-                        name_elem = product.select_one('.product-name, .title, h3, h4, a')
-                        if name_elem:
-                            name = name_elem.text.strip()
-                    
-                    if not name:
-                         continue
-
-                    # Extract BTU from product name
-                    btu_match = re.search(r'(\d+)\s*BTU', name, re.IGNORECASE)
-                    btu = int(btu_match.group(1)) if btu_match else None
-                    
-                    # Extract price
-                    price_elem = product.select_one('.price, .product-price, .amount, .sell-price')
-                    price = price_elem.text.strip() if price_elem else 'N/A'
-                    
-                    # Only add if it looks like an AC
-                    if btu or 'AIR CONDITIONER' in name.upper():
-                        self.products.append({
-                            'brand': 'Singer',
-                            'name': name,
-                            'btu': btu,
-                            'price': price,
-                            'url': url
-                        })
-                except Exception as e:
-                    continue
-                    
-            print(f"✓ Found {len([p for p in self.products if p['brand'] == 'Singer'])} Singer products")
-            
-        except Exception as e:
-            print(f"✗ Error scraping Singer: {e}")
+        Returns True only if every retailer was fetched and parsed without an error.
+        """
+        http_cache = self._load_http_cache()
+        timeout = aiohttp.ClientTimeout(total=20)
+        connector = aiohttp.TCPConnector(limit=POOL_MAXSIZE, limit_per_host=POOL_PER_HOST)
+        async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout, connector=connector) as session:
+            results = await asyncio.gather(
+                *(self.scrape_site(session, cfg, http_cache.get(cfg['url'])) for cfg in self.retailers),
+                return_exceptions=True
+            )
+        
+        complete = True
+        for cfg, result in zip(self.retailers, results):
+            if isinstance(result, Exception):
+                print(f"✗ Error scraping {cfg['brand']}: {result}")
+                complete = False
+                continue
+            rows, headers = result
+            if rows is None:
+                # Unchanged (304) pages have nothing to parse; their rows come from the previous run
+                rows = http_cache.get(cfg['url'], {}).get('rows', [])
+                print(f"✓ {cfg['brand']} unchanged since last run, reusing {len(rows)} products")
+            elif rows and headers is not None:
+                http_cache[cfg['url']] = {
+                    'etag': headers.get('ETag'),
+                    'last_modified': headers.get('Last-Modified'),
+                    'rows': rows
+                }
+            for name, btu, price in rows:
+                self.add_product(brand=cfg['brand'], name=name, btu=btu, price=price, url=cfg['url'])
+        
+        self._save_http_cache(http_cache)
+        return complete
     
-    def scrape_abans(self):
-        """Scrape Abans website for AC products"""
-        url = "https://buyabans.com/home-appliance/air-conditioners"
+    async def scrape_site(self, session, cfg, validators=None):
+        """
+        Fetch one retailer's listing and parse it into (name, btu, price) rows
         
-        try:
-            # Abans seems to load products dynamically. This simple request might fail to get products.
-            # We'll try to get the initial HTML, but it might be empty of products.
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            }
-            response = requests.get(url, headers=headers, timeout=20)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Abans uses col-lg-3 for grid items usually
-            products = soup.select('.product-card, .col-lg-3, .product-item')
-            
-            found_count = 0
-            for product in products:
-                try:
-                    name_elem = product.select_one('.pro-name-compact, .pro-name, h4 a, .product-name')
-                    name = name_elem.text.strip() if name_elem else ''
-                    
-                    if not name:
-                        continue
-                    
-                    # Extract BTU
-                    btu_match = re.search(r'(\d+)\s*BTU', name, re.IGNORECASE)
-                    btu = int(btu_match.group(1)) if btu_match else None
-                    
-                    # Extract price
-                    price_elem = product.select_one('.price-new, .selling-price, .price, .sale-price')
-                    price = price_elem.text.strip() if price_elem else 'N/A'
-                    
-                    self.products.append({
-                        'brand': 'Abans',
-                        'name': name,
-                        'btu': btu,
-                        'price': price,
-                        'url': url
-                    })
-                    found_count += 1
-                except Exception as e:
-                    continue
-            
-            if found_count == 0:
-                 print("ℹ️  Abans website structure might be dynamic. Trying fallback search...")
-                 # Fallback: scrape from search page if possible or note limitation
-                 
-            print(f"✓ Found {found_count} Abans products")
-            
-        except Exception as e:
-            print(f"✗ Error scraping Abans: {e}")
+        Parsing runs in a worker thread so the event loop keeps serving the other
+        retailers' downloads. Returns (rows, response headers); rows is None when the
+        page is unchanged since the last run. Headers are None for truncated pages so
+        their partial rows are never revalidated. Fetch and parse errors propagate.
+        """
+        brand = cfg['brand']
+        
+        html, headers, truncated = await _fetch(session, cfg['url'], validators)
+        if html is None:
+            return None, headers
+        rows = await asyncio.to_thread(cfg['parse'], html)
+        
+        if not rows:
+            # Sites such as Abans load products dynamically, so the initial HTML may have none
+            print(f"ℹ️  {brand} page yielded no products")
+        else:
+            print(f"✓ Found {len(rows)} {brand} products")
+        return rows, None if truncated else headers
     
     def analyze_with_ai(self, products_list):
-        """Use OpenAI to analyze and compare products"""
+        """Use OpenAI to analyze and compare products, printing the analysis as it streams in"""
+        
+        # The same SKU can match several grid wrappers, so drop repeats before building the prompt
+        seen = set()
+        products_list = [
+            p for p in products_list
+            if (p['brand'], p['name']) not in seen and not seen.add((p['brand'], p['name']))
+        ]
         
         products_text = "\n".join([
             f"- {p['brand']}: {p['name']} | BTU: {p['btu']} | Price: {p['price']}"
@@ -144,61 +255,172 @@ class ACFinderAgent:
         ])
         
         if not products_text:
+             print("No products found to analyze.")
              return "No products found to analyze."
 
-        prompt = f"""Analyze these air conditioner products and provide:
-1. Best value for money
-2. Most energy efficient options
-3. Recommendations based on BTU capacity
-4. Price comparison between brands
+        prompt = f"Products:\n{products_text}"
+        model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 
-Products:
-{products_text}
-
-Provide a concise analysis and recommendation."""
+        key = self._cache_key(model, prompt)
+        cache = self._load_ai_cache()
+        if key in cache:
+            print(cache[key])
+            return cache[key]
 
+        analysis = ""
         try:
             response = self.client.chat.completions.create(
-                model="gpt-4",
+                model=model,
                 messages=[
-                    {"role": "system", "content": "You are an expert in air conditioning systems and consumer electronics."},
+                    {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.7,
-                max_tokens=500
+                max_tokens=500,
+                stream=True
             )
             
-            return response.choices[0].message.content
+            # Write tokens as they arrive so the first words show up immediately
+            for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    sys.stdout.write(delta)
+                    sys.stdout.flush()
+                    analysis += delta
+            print()
+            
+            cache[key] = analysis
+            self._save_ai_cache(cache)
+            return analysis
             
         except Exception as e:
+            if analysis:
+                print()
+            print(f"AI analysis failed: {e}")
             return f"AI analysis failed: {e}"
     
+    def analyze_batch(self, prompts):
+        """
+        Run several analysis prompts concurrently and return their results in order
+        
+        Nothing calls this yet: run() makes a single streamed analyze_with_ai call. It is
+        the entry point for multi-call analyses such as per-brand or follow-up prompts.
+        """
+        model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        keys = [self._cache_key(model, prompt) for prompt in prompts]
+        cache = self._load_ai_cache()
+        
+        pending = [(key, prompt) for key, prompt in zip(keys, prompts) if key not in cache]
+        failed = {}
+        if pending:
+            results = asyncio.run(self._analyze_pending(model, [prompt for _, prompt in pending]))
+            for (key, _), result in zip(pending, results):
+                if isinstance(result, Exception):
+                    failed[key] = f"AI analysis failed: {result}"
+                else:
+                    cache[key] = result
+            self._save_ai_cache(cache)
+        
+        return [cache[key] if key in cache else failed[key] for key in keys]
+    
+    async def _analyze_pending(self, model, prompts):
+        """Issue the prompts concurrently, at most MAX_CONCURRENT_AI_CALLS at a time"""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_AI_CALLS)
+        # The async client's connection pool is tied to this event loop, so it lives only as long as the call
+        async with AsyncOpenAI(api_key=self._api_key) as client:
+            return await asyncio.gather(
+                *(self._analyze_one(client, semaphore, model, prompt) for prompt in prompts),
+                return_exceptions=True
+            )
+    
+    @retry(
+        retry=retry_if_exception_type(RETRYABLE_AI_ERRORS),
+        stop=stop_after_attempt(5),
+        wait=wait_random_exponential(min=1, max=30),
+        reraise=True
+    )
+    async def _analyze_one(self, client, semaphore, model, prompt):
+        """Run one analysis prompt, retrying rate limits and transient API errors with backoff"""
+        async with semaphore:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.7,
+                max_tokens=500
+            )
+        return response.choices[0].message.content
+    
+    def _cache_key(self, model, prompt):
+        """Identical prompts for the same target and model reuse the previous analysis"""
+        return hashlib.sha256(f"{model}\n{SYSTEM_PROMPT}\n{prompt}\n{self.target_btu}".encode()).hexdigest()
+    
+    def _load_http_cache(self):
+        """Load per-URL ETag/Last-Modified validators and the rows parsed from that response"""
+        try:
+            return orjson.loads(self._http_cache_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_http_cache(self, http_cache):
+        """Persist HTTP validators and parsed rows for the next conditional fetch"""
+        try:
+            self._http_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._http_cache_path.write_bytes(orjson.dumps(http_cache))
+        except (OSError, orjson.JSONEncodeError) as e:
+            print(f"✗ Could not write HTTP cache: {e}")
+    
+    def _load_ai_cache(self):
+        """Load cached AI analyses from disk"""
+        try:
+            return orjson.loads(self._cache_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_ai_cache(self, cache):
+        """Persist cached AI analyses to disk"""
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._cache_path.write_bytes(orjson.dumps(cache, option=orjson.OPT_INDENT_2))
+        except (OSError, orjson.JSONEncodeError) as e:
+            print(f"✗ Could not write AI cache: {e}")
+    
     def find_matching_btu(self):
         """Find products matching target BTU"""
         if not self.target_btu:
-            return self.products
+            return self.dicts()
+        
+        # Compare the whole BTU column in one vectorized pass; -1 marks products with no parsed BTU
+        btu_col = self._cols['btu']
+        btus = np.fromiter((b or -1 for b in btu_col), dtype=np.int64, count=len(btu_col))
+        # Targets far outside the stored range match nothing either way, so clamp them to stay in int64
+        target = min(max(self.target_btu, -MAX_BTU), 2 * MAX_BTU)
+        has_btu = btus > 0
+        exact = has_btu & (btus == target)
+        close = has_btu & (np.abs(btus - target) <= 2000) & ~exact
         
         # Find exact matches and close matches (within 2000 BTU)
-        matches = []
-        for product in self.products:
-            # If product has no BTU extracted, we might still want to list it if it mentions 'Air Conditioner'
-            p_btu = product.get('btu')
-            
-            if p_btu:
-                if p_btu == self.target_btu:
-                    product['match_type'] = 'exact'
-                    matches.append(product)
-                elif abs(p_btu - self.target_btu) <= 2000:
-                    product['match_type'] = 'close'
-                    matches.append(product)
-            else:
+        names = self._cols['name']
+        match_types = self._cols['match_type']
+        matched = []
+        for i in np.nonzero(exact | close | ~has_btu)[0]:
+            if exact[i]:
+                match_types[i] = 'exact'
+            elif close[i]:
+                match_types[i] = 'close'
+            elif str(self.target_btu) in names[i]:
                 # Include products where BTU wasn't parsed but might be relevant
                 # especially if user input matches part of the name
-                if str(self.target_btu) in product['name']:
-                     product['match_type'] = 'possible'
-                     matches.append(product)
+                match_types[i] = 'possible'
+            else:
+                continue
+            matched.append(int(i))
         
-        return matches
+        return self.dicts(matched)
     
     def send_notification(self, message):
         """Print notification (can be extended to email/SMS)"""
@@ -214,11 +436,17 @@ Provide a concise analysis and recommendation."""
         """Main execution method"""
         print("\n🤖 AC Finder Agent Starting...")
         
-        # Scrape both websites
-        print("📡 Scraping websites...")
-        self.scrape_singer()
-        self.scrape_abans()
+        # A recent run for the same target today is replayed instead of scraping again
+        cached = self._load_run_cache()
+        if cached:
+            print(f"♻️  Reusing results from {cached['saved_at']}")
+            for row in cached['products']:
+                self.add_product(**row)
+        else:
+            print("📡 Scraping websites...")
+            complete = asyncio.run(self.scrape_all())
         
+        analysis = None
         # Find matching products
         if self.target_btu:
             print(f"\n🔍 Searching for {self.target_btu} BTU...")
@@ -235,37 +463,80 @@ Provide a concise analysis and recommendation."""
                 self.send_notification(notification)
                 
                 # AI Analysis
-                print("\n🧠 AI Analysis:")
-                print("-" * 60)
-                analysis = self.analyze_with_ai(matches)
-                print(analysis)
+                analysis = self._run_analysis(matches, cached)
                 
             else:
                 self.send_notification(f"No products found matching {self.target_btu} BTU")
         else:
             # Show all products with AI analysis
-            print(f"\n📊 Total products found: {len(self.products)}")
+            print(f"\n📊 Total products found: {len(self._cols['name'])}")
             
-            if self.products:
-                print("\n🧠 AI Analysis:")
-                print("-" * 60)
-                analysis = self.analyze_with_ai(self.products)
-                print(analysis)
+            if self._cols['name']:
+                analysis = self._run_analysis(self.dicts(), cached)
+        
+        if cached:
+            return
         
-        # Save results
+        # Save results; only a full, non-empty scrape is worth replaying later
+        if complete and self._cols['name']:
+            self._save_run_cache(analysis)
         self.save_results()
     
+    def _run_analysis(self, products_list, cached):
+        """Print the AI analysis section, replaying a cached analysis when there is one"""
+        print("\n🧠 AI Analysis:")
+        print("-" * 60)
+        if cached and cached['analysis']:
+            print(cached['analysis'])
+            return cached['analysis']
+        return self.analyze_with_ai(products_list)
+    
+    def _run_cache_path(self):
+        """Cache file for today's run at this target, e.g. 20260210_12000.json"""
+        return CACHE_DIR / f"{datetime.now().strftime('%Y%m%d')}_{self.target_btu or 'all'}.json"
+    
+    def _load_run_cache(self):
+        """Load today's cached run for this target if it is younger than RUN_CACHE_TTL"""
+        try:
+            cached = orjson.loads(self._run_cache_path().read_bytes())
+            age = datetime.now() - datetime.fromisoformat(cached['saved_at'])
+            if not cached['products'] or 'analysis' not in cached:
+                return None
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if age.total_seconds() > RUN_CACHE_TTL:
+            return None
+        return cached
+    
+    def _save_run_cache(self, analysis):
+        """Persist this run's products and analysis for _load_run_cache"""
+        if analysis and analysis.startswith("AI analysis failed"):
+            analysis = None
+        payload = {
+            'saved_at': datetime.now().isoformat(),
+            'date': datetime.now().strftime('%Y%m%d'),
+            'btu': self.target_btu,
+            'products': self.dicts(),
+            'analysis': analysis
+        }
+        try:
+            path = self._run_cache_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(orjson.dumps(payload))
+        except (OSError, orjson.JSONEncodeError) as e:
+            print(f"✗ Could not write run cache: {e}")
+    
     def save_results(self):
         """Save results to JSON file"""
         filename = f"ac_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
-        with open(filename, 'w') as f:
-            json.dump({
-                'timestamp': datetime.now().isoformat(),
-                'target_btu': self.target_btu,
-                'total_products': len(self.products),
-                'products': self.products
-            }, f, indent=2)
+        payload = {
+            'timestamp': datetime.now().isoformat(),
+            'target_btu': self.target_btu,
+            'total_products': len(self._cols['name']),
+            'products': self.dicts()
+        }
+        pathlib.Path(filename).write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
         
         print(f"\n💾 Results saved to: {filename}")
 
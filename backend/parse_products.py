@@ -0,0 +1,109 @@
+"""
+Listing page parsers for the AC Finder Agent
+Kept free of agent state and fully annotated so mypyc can compile them (see setup.py)
+"""
+
+import re
+from typing import List, Optional, Tuple, Union
+
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+# (name, btu, price) for one product card
+Product = Tuple[str, Optional[int], str]
+
+_BTU_RE = re.compile(r'(\d+)\s*BTU', re.IGNORECASE)
+
+# Largest BTU value accepted; longer digit runs before "BTU" are treated as no BTU
+MAX_BTU = 10 ** 7
+
+# Per-site CSS selectors (selectolax still parses the selector text on every call).
+# Card lists use :is() so a card matching several classes is returned once, in document order
+_SINGER_CARDS = ':is(.product, .productfilter, .views-row)'
+# Image alt text or a name-like element, whichever comes first in the card, found in one lookup;
+# the separate image and text selectors are only tried when that yields no name
+_SINGER_NAME = 'img[alt], .product-name, .title, h3, h4, a'
+_SINGER_IMG = 'img[alt]'
+_SINGER_TEXT = '.product-name, .title, h3, h4, a'
+_SINGER_PRICE = '.price, .product-price, .amount, .sell-price'
+
+_ABANS_CARDS = ':is(.product-card, .col-lg-3, .product-item)'
+_ABANS_NAME = '.pro-name-compact, .pro-name, h4 a, .product-name'
+_ABANS_PRICE = '.price-new, .selling-price, .price, .sale-price'
+
+
+def _parse_btu(name: str) -> Optional[int]:
+    """Extract the BTU rating from a product name, or None if absent or implausibly large"""
+    btu_match = _BTU_RE.search(name)
+    if not btu_match:
+        return None
+    digits = btu_match.group(1)
+    # Check the length first so a huge digit run never reaches int()
+    if len(digits) > len(str(MAX_BTU)):
+        return None
+    btu = int(digits)
+    return btu if btu <= MAX_BTU else None
+
+
+def _node_name(elem: Optional[LexborNode]) -> str:
+    """Product name carried by a node: an image's alt text, otherwise its text"""
+    if elem is None:
+        return ''
+    if elem.tag == 'img':
+        return (elem.attributes.get('alt') or '').strip()
+    return elem.text().strip()
+
+
+def parse_singer_html(html: Union[str, bytes]) -> List[Product]:
+    """Parse Singer AC listing HTML into products"""
+    tree = LexborHTMLParser(html)
+    found: List[Product] = []
+    
+    # Find product containers based on debug findings
+    # Look for common product wrappers
+    for product in tree.css(_SINGER_CARDS):
+        # Image alt text usually holds the full product name; a link wrapping the image has
+        # no text of its own, so an empty result falls back to image first, then text
+        name: str = _node_name(product.css_first(_SINGER_NAME))
+        if not name:
+            name = _node_name(product.css_first(_SINGER_IMG)) or _node_name(product.css_first(_SINGER_TEXT))
+        
+        if not name:
+            continue
+        
+        # Extract BTU from product name
+        btu = _parse_btu(name)
+        
+        # Extract price
+        price_elem = product.css_first(_SINGER_PRICE)
+        price: str = price_elem.text().strip() if price_elem is not None else 'N/A'
+        
+        # Only add if it looks like an AC
+        if btu or 'AIR CONDITIONER' in name.upper():
+            found.append((name, btu, price))
+    
+    return found
+
+
+def parse_abans_html(html: Union[str, bytes]) -> List[Product]:
+    """Parse Abans AC listing HTML into products"""
+    tree = LexborHTMLParser(html)
+    found: List[Product] = []
+    
+    # Abans uses col-lg-3 for grid items usually
+    for product in tree.css(_ABANS_CARDS):
+        name_elem = product.css_first(_ABANS_NAME)
+        name: str = name_elem.text().strip() if name_elem is not None else ''
+        
+        if not name:
+            continue
+        
+        # Extract BTU
+        btu = _parse_btu(name)
+        
+        # Extract price
+        price_elem = product.css_first(_ABANS_PRICE)
+        price: str = price_elem.text().strip() if price_elem is not None else 'N/A'
+        
+        found.append((name, btu, price))
+    
+    return found
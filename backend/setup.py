@@ -0,0 +1,16 @@
+"""
+Optional build step: compile the listing parsers to a C extension with mypyc
+
+    pip install mypy
+    python setup.py build_ext --inplace
+
+agent.py imports parse_products the same way whether or not it has been compiled.
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name='ac-finder-parsers',
+    ext_modules=mypycify(['parse_products.py']),
+)
@@ -0,0 +1,76 @@
+"""
+Fixture tests for the listing parsers
+Expected rows are what the original BeautifulSoup implementation returned for the same HTML
+"""
+
+import unittest
+
+from parse_products import parse_abans_html, parse_singer_html
+
+SINGER_HTML = """
+<html><body>
+<div class="views-row product">
+  <a href="/p/1"><img src="1.jpg" alt="Singer 12000 BTU Inverter Air Conditioner"></a>
+  <h3>Singer Inverter</h3>
+  <span class="sell-price">Rs. 189,999</span>
+  <span class="price">Rs. 209,999</span>
+</div>
+<div class="productfilter">
+  <img src="2.jpg" alt="">
+  <a href="/p/2">Singer 18000 BTU Air Conditioner</a>
+  <h3>Heading only</h3>
+</div>
+<div class="product">
+  <h4>Singer Wall Fan</h4>
+  <span class="price">Rs. 9,999</span>
+</div>
+<div class="views-row">
+  <span class="title">Singer Split Air Conditioner</span>
+  <span class="amount">Rs. 150,000</span>
+</div>
+</body></html>
+"""
+
+ABANS_HTML = """
+<html><body>
+<div class="col-lg-3 product-card">
+  <h4><a href="/a/1">Abans 9000 BTU Non-Inverter</a></h4>
+  <div class="pro-name">Abans 9000BTU Non Inverter AC</div>
+  <span class="price">Rs. 120,000</span>
+  <span class="price-new">Rs. 110,000</span>
+</div>
+<div class="product-item">
+  <div class="pro-name-compact">Abans 24000 BTU Inverter</div>
+</div>
+<div class="col-lg-3"><p>Advert</p></div>
+</body></html>
+"""
+
+
+class ParseSingerTest(unittest.TestCase):
+    def test_matches_bs4_output(self):
+        self.assertEqual(parse_singer_html(SINGER_HTML), [
+            ('Singer 12000 BTU Inverter Air Conditioner', 12000, 'Rs. 189,999'),
+            ('Singer 18000 BTU Air Conditioner', 18000, 'N/A'),
+            ('Singer Split Air Conditioner', None, 'Rs. 150,000'),
+        ])
+    
+    def test_accepts_bytes(self):
+        self.assertEqual(parse_singer_html(SINGER_HTML.encode()), parse_singer_html(SINGER_HTML))
+
+
+    def test_implausible_btu_is_dropped(self):
+        html = '<div class="product"><img alt="Air Conditioner 123456789012345678901234 BTU"></div>'
+        self.assertEqual(parse_singer_html(html), [('Air Conditioner 123456789012345678901234 BTU', None, 'N/A')])
+
+
+class ParseAbansTest(unittest.TestCase):
+    def test_matches_bs4_output(self):
+        self.assertEqual(parse_abans_html(ABANS_HTML), [
+            ('Abans 9000 BTU Non-Inverter', 9000, 'Rs. 120,000'),
+            ('Abans 24000 BTU Inverter', 24000, 'N/A'),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()